@@ -2,9 +2,9 @@ from typing import Annotated
 from enum import Enum
 
 from pydantic.dataclasses import dataclass
-from pydantic import Field, model_validator as validator
+from pydantic import Field
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Connection:
     driver: str
     username: str
@@ -13,13 +13,13 @@ class Connection:
     port: int
     database: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Column:
     name: str
     type: str
     description: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Schema:
     target: Column
     features: list[Column]
@@ -31,7 +31,7 @@ class Loss(Enum):
     HUBER = 'huber'
     QUANTILE = 'quantile'
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Hyperparameters:
     loss: Loss
     learning_rate: Annotated[float, Field(gt=0.0, lt=1.0)]
@@ -39,16 +39,14 @@ class Hyperparameters:
     max_depth: Annotated[int, Field(ge=1)]
     min_samples_split: Annotated[int, Field(ge=1)]
 
-    @validator(mode="after")
-    def check_complexity(self):
+    def __post_init__(self):
         """Check whether the model is complex enough."""
         
-        assert (self.max_depth + self.n_estimators) >= 4, "the model is not complex enough"
+        if self.max_depth + self.n_estimators < 4:
+            raise ValueError("the model is not complex enough")
 
-        return self
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Configuration:
     connection: Connection
     schema: Schema
@@ -1,11 +1,28 @@
+import sys
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING
+
 import flytekit as fk
 import hydra
-from omegaconf import DictConfig
-from union.remote import UnionRemote
+from hydra.core.hydra_config import HydraConfig
+from hydra.types import RunMode
+from omegaconf import DictConfig, OmegaConf
+from flytekit.core.workflow import WorkflowBase
+from flytekit.remote import FlyteWorkflow
 
 from flyte_hydra.structs import Column, Configuration
 
-image = fk.ImageSpec(packages=["flytekit==1.14.0b5", "hydra-core", "pydantic"])
+# the union remote client is only needed to launch executions, not inside tasks
+if TYPE_CHECKING:
+    from union.remote import UnionRemote
+
+# flytekit is installed from its locked git revision, which needs git in the image
+image = fk.ImageSpec(
+    apt_packages=["git"],
+    packages=["flytekit @ git+https://github.com/flyteorg/flytekit.git@6e4e53bb89debbeef764d3a0a16e499e0bcd18e2", "hydra-core==1.3.2", "pydantic==2.9.2"],
+)
 
 @fk.task(container_image=image)
 def show_lr(lr: float):
@@ -14,9 +31,9 @@ def show_lr(lr: float):
 
 
 @fk.task(container_image=image)
-def show_column(column: Column):
+def show_columns(columns: list[Column]):
 
-    print(column)
+    print(*columns, sep="\n")
 
 @fk.workflow
 def my_workflow(config: Configuration):
@@ -24,24 +41,63 @@ def my_workflow(config: Configuration):
     # use only the "learning_rate" attribute of the "hyperparameters" dataclass
     show_lr(config.hyperparameters.learning_rate)
 
-    # map over the list of "features" in the "schema" dataclass
-    fk.map_task(show_column)(config.schema.features)
-    
+    # pass the whole list of "features" in the "schema" dataclass to a single task
+    show_columns(config.schema.features)
 
-@hydra.main(version_base="1.3", config_path="config", config_name="config")
-def app(config: DictConfig) -> None:
-    
-    # instantiate dataclasses from DictConfig
-    config: Configuration = hydra.utils.instantiate(config, _convert_="object", _target_=Configuration)
 
-    # create Union remote connection
-    remote = UnionRemote(default_domain="development", default_project="default")
-    
+# Union remote connection, reused across the jobs of a multirun
+@cache
+def get_remote() -> "UnionRemote":
+
+    from union.remote import UnionRemote
+
+    return UnionRemote(default_domain="development", default_project="default")
+
+
+# registered workflows, reused across the jobs of a multirun
+@cache
+def register(workflow: WorkflowBase) -> FlyteWorkflow:
+
+    return get_remote().fast_register_workflow(workflow)
+
+
+def execute(remote: "UnionRemote", workflow: FlyteWorkflow, config: Configuration) -> None:
+
     # execute workflow with configurations
-    run = remote.execute(remote.fast_register_workflow(my_workflow), inputs={"config": config})
+    run = remote.execute(workflow, inputs={"config": config})
     
     # print execution URL
     print(run.execution_url)
 
+
+# executions submitted concurrently during a multirun
+executor = ThreadPoolExecutor()
+executions: list[Future] = []
+
+@hydra.main(version_base="1.3", config_path="config", config_name="config")
+def app(config: DictConfig) -> None:
+    
+    # instantiate dataclasses from a plain container of the DictConfig
+    config: Configuration = Configuration(**OmegaConf.to_container(config, resolve=True))
+
+    remote = get_remote()
+    workflow = register(my_workflow)
+
+    # do not block on each job of a multirun
+    if HydraConfig.get().mode == RunMode.MULTIRUN:
+        executions.append(executor.submit(execute, remote, workflow, config))
+    else:
+        execute(remote, workflow, config)
+
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    try:
+        app()
+    finally:
+        # wait for concurrent executions, even if a job failed, and report every failure
+        failures = [error for execution in executions if (error := execution.exception()) is not None]
+
+        for error in failures:
+            traceback.print_exception(error)
+
+        if failures:
+            sys.exit(1)
\ No newline at end of file